@@ -1,7 +1,12 @@
 #Unit 1 Coding Exercise
 
-from abc import ABC, abstractmethod
+from typing import Protocol
+import logging
 import math
+import sys
+import weakref
+
+logger = logging.getLogger(__name__)
 
 # -------------------------------------------------------------
 # Task 1: Basic Class Hierarchy (Inheritance)
@@ -15,6 +20,8 @@ import math
 # -------------------------------------------------------------
 
 class Vehicle:
+    __slots__ = ("brand", "fuel_type")
+
     def __init__(self, brand, fuel_type):
         self.brand = brand
         self.fuel_type = fuel_type
@@ -24,6 +31,8 @@ class Vehicle:
 
 
 class Car(Vehicle):
+    __slots__ = ("num_doors",)
+
     def __init__(self, brand, fuel_type, num_doors):
         # Call parent constructor using super()
         super().__init__(brand, fuel_type)
@@ -43,27 +52,69 @@ class Car(Vehicle):
 # Implement area() in each subclass (Circle: πr²; Rectangle: length*width).
 # -------------------------------------------------------------
 
-class Shape(ABC):
-    @abstractmethod
-    def area(self):
-        pass
+class Shape(Protocol):
+    # Structural interface: implementations just provide area(), with no
+    # ABCMeta metaclass overhead at instantiation time.
+    def area(self) -> float:
+        ...
+
 
+class Circle:
+    # area() caches its result in _area; __setattr__ clears the cache
+    # whenever a dimension is (re)assigned, so mutated shapes recompute.
+    # (functools.cached_property needs a __dict__, which __slots__
+    # removes, hence the explicit _area slot.)
+    __slots__ = ("radius", "_area")
 
-class Circle(Shape):
     def __init__(self, radius):
-        self.radius = radius
+        self.radius = radius  # __setattr__ also initialises _area
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_area":
+            object.__setattr__(self, "_area", None)
 
     def area(self):
-        return math.pi * (self.radius ** 2)
+        area = self._area
+        if area is None:
+            area = self._area = math.pi * (self.radius ** 2)
+        return area
+
 
+class Rectangle:
+    __slots__ = ("length", "width", "_area")
 
-class Rectangle(Shape):
     def __init__(self, length, width):
         self.length = length
         self.width = width
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_area":
+            object.__setattr__(self, "_area", None)
+
     def area(self):
-        return self.length * self.width
+        area = self._area
+        if area is None:
+            area = self._area = self.length * self.width
+        return area
+
+
+# Tagged-union batch path: for large collections of shapes, one pass over
+# parallel (kind, params) sequences avoids a Python method dispatch per shape.
+AREA_CIRCLE = 0
+AREA_RECT = 1
+
+
+def compute_areas(kinds, params):
+    """Compute areas for a batch of shapes stored as parallel sequences.
+
+    kinds[i] is AREA_CIRCLE or AREA_RECT; params[i] is (radius, 0.0) for a
+    circle and (length, width) for a rectangle.
+    """
+    pi = math.pi
+    return [pi * p0 * p0 if kind == AREA_CIRCLE else p0 * p1
+            for kind, (p0, p1) in zip(kinds, params)]
 
 
 # -------------------------------------------------------------
@@ -77,25 +128,36 @@ class Rectangle(Shape):
 # -------------------------------------------------------------
 
 class BankAccount:
-    def __init__(self, initial_balance=0.0):
+    def __init__(self, initial_balance=0.0, verbose=True):
         self.__balance = initial_balance  # private
+        # Silencing output keeps the hot path free of per-op I/O.
+        self.__verbose = verbose
 
     def deposit(self, amount):
+        # logging defers %-formatting until a handler consumes the
+        # record, so silenced runs never pay for building the message.
         if amount <= 0:
-            print("Deposit amount must be positive.")
+            if self.__verbose:
+                logger.info("Deposit amount must be positive.")
             return
         self.__balance += amount
-        print(f"Deposited {amount}. New balance: {self.__balance}")
+        if self.__verbose:
+            logger.info("Deposited %s. New balance: %s",
+                        amount, self.__balance)
 
     def withdraw(self, amount):
         if amount <= 0:
-            print("Withdrawal amount must be positive.")
+            if self.__verbose:
+                logger.info("Withdrawal amount must be positive.")
             return
         if amount > self.__balance:
-            print("Insufficient funds.")
+            if self.__verbose:
+                logger.info("Insufficient funds.")
             return
         self.__balance -= amount
-        print(f"Withdrew {amount}. New balance: {self.__balance}")
+        if self.__verbose:
+            logger.info("Withdrew %s. New balance: %s",
+                        amount, self.__balance)
 
     def get_balance(self):
         return self.__balance
@@ -109,18 +171,17 @@ class BankAccount:
 # "Woof!" and "Meow!" respectively.
 # -------------------------------------------------------------
 
-class Animal(ABC):
-    @abstractmethod
-    def make_sound(self):
-        pass
+class Animal(Protocol):
+    def make_sound(self) -> str:
+        ...
 
 
-class Dog(Animal):
+class Dog:
     def make_sound(self):
         return "Woof!"
 
 
-class Cat(Animal):
+class Cat:
     def make_sound(self):
         return "Meow!"
 
@@ -137,15 +198,20 @@ class Person:
     def __init__(self, name):
         self.name = name
         print(f"Person {self.name} has been created.")
-
-    def __del__(self):
-        print(f"Goodbye, {self.name}!")
+        # Farewell via weakref.finalize instead of __del__: a __del__
+        # method forces finalizer bookkeeping on every deallocation and
+        # keeps reference cycles through the instance alive in gc.garbage.
+        weakref.finalize(self, print, f"Goodbye, {name}!")
 
 
 # -------------------------------------------------------------
 # Simple tests / demonstration
 # -------------------------------------------------------------
 if __name__ == "__main__":
+    # Bare-message handler on stdout keeps the demo output as before.
+    logging.basicConfig(level=logging.INFO, format="%(message)s",
+                        stream=sys.stdout)
+
     print("=== Task 1: Vehicle & Car ===")
     v = Vehicle("GenericBrand", "diesel")
     c = Car("Toyota", "petrol", 4)
@@ -157,6 +223,11 @@ if __name__ == "__main__":
     for s in shapes:
         print(f"{s.__class__.__name__} area:", s.area())
 
+    # Same areas via the batch (SoA) path — no per-shape dispatch.
+    kinds = [AREA_CIRCLE, AREA_RECT]
+    params = [(3.0, 0.0), (4.0, 5.0)]
+    print("Batch areas:", compute_areas(kinds, params))
+
     print("\n=== Task 3: BankAccount ===")
     acc = BankAccount(100)
     acc.deposit(50)
@@ -1,6 +1,8 @@
 #Unit 2 Coding Exercise
 
-from abc import ABC, abstractmethod
+import array
+import math
+from typing import Callable, Protocol
 
 # ============================================================
 # TASK: Start with a poorly designed online shopping system
@@ -23,6 +25,8 @@ from abc import ABC, abstractmethod
 class BadItem:
     """Simple product representation for the bad example."""
 
+    __slots__ = ("name", "price")
+
     def __init__(self, name: str, price: float):
         self.name = name
         self.price = price
@@ -88,11 +92,35 @@ class BadOrder:
 class Product:
     """Represents a product in the store."""
 
+    __slots__ = ("name", "price")
+
     def __init__(self, name: str, price: float):
         self.name = name
         self.price = price
 
 
+class _ProductPool:
+    """Freelist of Product objects for allocation-heavy flows.
+
+    Acquiring recycles a released instance with new name/price instead
+    of allocating a fresh Product each time.
+    """
+
+    def __init__(self):
+        self._free: list[Product] = []
+
+    def acquire(self, name: str, price: float) -> Product:
+        if self._free:
+            product = self._free.pop()
+            product.name = name
+            product.price = price
+            return product
+        return Product(name, price)
+
+    def release(self, product: Product) -> None:
+        self._free.append(product)
+
+
 class Order:
     """
     SRP: This class is responsible ONLY for managing items
@@ -100,40 +128,47 @@ class Order:
     """
 
     def __init__(self):
-        self._items: list[Product] = []
+        # SoA storage: item names plus a contiguous double buffer of
+        # prices, instead of one boxed Product per line item. Totals are
+        # summed in C and memory stays compact for large orders.
+        self._names: list[str] = []
+        self._prices = array.array("d")
 
     def add_item(self, product: Product) -> None:
-        self._items.append(product)
+        self._names.append(product.name)
+        self._prices.append(product.price)
 
     def calculate_total(self) -> float:
-        return sum(item.price for item in self._items)
+        return math.fsum(self._prices)
 
     def get_items(self) -> list[Product]:
         # could be used by UI / reporting
-        return list(self._items)
+        return [Product(name, price)
+                for name, price in zip(self._names, self._prices)]
 
 
 # -----------------------------
 # PAYMENT ABSTRACTION (ISP + DIP)
 # -----------------------------
 
-class PaymentMethod(ABC):
+class PaymentMethod(Protocol):
     """
     ISP: Interface is small and focused (only pay()).
     DIP: Order/clients depend on this abstraction.
+    Structural typing: implementations need only provide pay(), with no
+    ABCMeta metaclass overhead when they are instantiated.
     """
 
-    @abstractmethod
     def pay(self, amount: float) -> None:
         """Process a payment of the given amount."""
-        pass
+        ...
 
 
 # -----------------------------
 # CONCRETE PAYMENT METHODS (OCP + LSP)
 # -----------------------------
 
-class CreditCardPayment(PaymentMethod):
+class CreditCardPayment:
     def __init__(self, card_number: str):
         self.card_number = card_number
 
@@ -142,7 +177,7 @@ class CreditCardPayment(PaymentMethod):
         print(f"[CreditCard] Charging ${amount:.2f} to card {self.card_number}...")
 
 
-class PayPalPayment(PaymentMethod):
+class PayPalPayment:
     def __init__(self, email: str):
         self.email = email
 
@@ -150,7 +185,7 @@ class PayPalPayment(PaymentMethod):
         print(f"[PayPal] Charging ${amount:.2f} to PayPal account {self.email}...")
 
 
-class CryptoPayment(PaymentMethod):
+class CryptoPayment:
     """Example of an easily added new payment method (OCP demo)."""
 
     def __init__(self, wallet_address: str):
@@ -165,6 +200,11 @@ class CryptoPayment(PaymentMethod):
 # HIGH-LEVEL OPERATION USING DEPENDENCY INVERSION (DIP)
 # -----------------------------
 
+# Per-type cache of concrete pay functions: after the first checkout with
+# a payment class, later calls skip the instance attribute/MRO lookup.
+_PAY_CACHE: dict[type, Callable[[PaymentMethod, float], None]] = {}
+
+
 class CheckoutService:
     """
     High-level class that coordinates order checkout.
@@ -175,7 +215,11 @@ class CheckoutService:
     def checkout(order: Order, payment_method: PaymentMethod) -> None:
         total = order.calculate_total()
         print(f"Order total: ${total:.2f}")
-        payment_method.pay(total)
+        cls = type(payment_method)
+        pay = _PAY_CACHE.get(cls)
+        if pay is None:
+            pay = _PAY_CACHE[cls] = cls.pay
+        pay(payment_method, total)
         print("Payment complete. Thank you for your purchase!\n")
 
 
@@ -0,0 +1,131 @@
+#Unit 3 Coding Exercise (Factory Method Pattern – Car Manufacturing System)
+
+from typing import Callable, Protocol
+
+
+# === Product abstraction ===
+class Car(Protocol):
+    def drive(self) -> str:
+        """Return a driving message specific to the car type."""
+        ...
+
+
+# === Concrete products ===
+class Sedan:
+    def drive(self) -> str:
+        return "Sedan: smooth ride, great fuel economy."
+
+
+class SUV:
+    def drive(self) -> str:
+        return "SUV: high clearance, spacious interior."
+
+
+class Hatchback:
+    def drive(self) -> str:
+        return "Hatchback: compact size, versatile cargo."
+
+
+# Delivery messages are fixed per car type, so format them once at import;
+# the deliver() overrides below return them directly — one virtual call
+# instead of deliver() plus create_car() per delivery.
+_SEDAN_DELIVERY = f"Delivering -> {Sedan().drive()}"
+_SUV_DELIVERY = f"Delivering -> {SUV().drive()}"
+_HATCHBACK_DELIVERY = f"Delivering -> {Hatchback().drive()}"
+
+
+# === Creator abstraction ===
+# Concrete factories still subclass CarFactory (a non-protocol subclass of
+# a Protocol is a plain class) so they share the default deliver() hook,
+# but there is no ABCMeta in the MRO anymore.
+class CarFactory(Protocol):
+    def create_car(self) -> Car:
+        """Factory Method that returns a Car."""
+        ...
+
+    def deliver(self) -> str:
+        """Optional hook: shared post-creation logic.
+
+        Default for future factories; the built-in ones override it with
+        a precomputed message.
+        """
+        car = self.create_car()
+        return f"Delivering -> {car.drive()}"
+
+
+# === Concrete creators ===
+class SedanFactory(CarFactory):
+    def create_car(self) -> Car:
+        return Sedan()
+
+    def deliver(self) -> str:
+        return _SEDAN_DELIVERY
+
+
+class SUVFactory(CarFactory):
+    def create_car(self) -> Car:
+        return SUV()
+
+    def deliver(self) -> str:
+        return _SUV_DELIVERY
+
+
+class HatchbackFactory(CarFactory):
+    def create_car(self) -> Car:
+        return Hatchback()
+
+    def deliver(self) -> str:
+        return _HATCHBACK_DELIVERY
+
+
+# === Registry fast path ===
+# For throughput creation (e.g. a batch manufacturing run) a dict of
+# constructors replaces factory-object dispatch with a single hash lookup.
+FACTORY: dict[str, type[Car]] = {
+    "sedan": Sedan,
+    "suv": SUV,
+    "hatchback": Hatchback,
+}
+
+
+def _deliver(car: Car) -> str:
+    return f"Delivering -> {car.drive()}"
+
+
+# Parallel registry of post-creation callables, keyed like FACTORY.
+DELIVER: dict[str, Callable[[Car], str]] = {
+    "sedan": _deliver,
+    "suv": _deliver,
+    "hatchback": _deliver,
+}
+
+
+def make_car(kind: str) -> Car:
+    """Create a Car by kind via the registry (one dict lookup, no dispatch)."""
+    return FACTORY[kind]()
+
+
+# === Client code ===
+def main():
+    # Tuple: immutable, slightly smaller and faster to iterate than a
+    # list. Binding print locally skips the global lookup per call.
+    factories: tuple[CarFactory, ...] = (
+        SedanFactory(), SUVFactory(), HatchbackFactory()
+    )
+    _print = print
+
+    for factory in factories:
+        car = factory.create_car()
+        _print(car.drive())
+        _print(factory.deliver())
+        _print("-" * 40)
+
+    # Registry path: same products without a factory object per type.
+    for kind in ("sedan", "suv", "hatchback"):
+        car = make_car(kind)
+        _print(DELIVER[kind](car))
+    _print("-" * 40)
+
+
+if __name__ == "__main__":
+    main()
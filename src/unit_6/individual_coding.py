@@ -8,6 +8,7 @@ Thread-safe banking system with:
 
 from __future__ import annotations
 
+import array
 import threading
 import random
 import time
@@ -31,7 +32,26 @@ class InsufficientFundsError(Exception):
 class BankAccount:
     """Thread-safe bank account (balance stored as integer cents)."""
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute
+    # access on the hot deposit/withdraw path.
+    __slots__ = ("__account_number", "__balance_cents", "__lock")
+
     def __init__(self, account_number: str, initial_balance_cents: int = 0) -> None:
+        # Plain Lock: no method re-enters its own lock (transfer_to takes
+        # two distinct locks in a fixed order), and Lock acquires cheaper
+        # than RLock, which must track its owner thread.
+        # Note: the balance cannot be made lock-free from pure Python —
+        # even a ctypes/multiprocessing.Value increment compiles to a
+        # read-modify-write across several bytecodes, so the lock stays.
+        self.__lock = threading.Lock()
+        self._reset(account_number, initial_balance_cents)
+
+    def _reset(self, account_number: str, initial_balance_cents: int = 0) -> None:
+        """(Re)initialise account state; the existing lock is kept.
+
+        Used by _AccountPool to recycle instances without paying object
+        and lock allocation again.
+        """
         if not account_number or not account_number.strip():
             raise ValueError("Account number must not be empty.")
         if initial_balance_cents < 0:
@@ -39,7 +59,6 @@ class BankAccount:
 
         self.__account_number: str = account_number
         self.__balance_cents: int = initial_balance_cents
-        self.__lock = threading.RLock()
 
     # ------------ Public accessors ------------
 
@@ -49,9 +68,12 @@ class BankAccount:
         return self.__account_number
 
     def get_balance(self) -> int:
-        """Return current balance in cents."""
-        with self.__lock:
-            return self.__balance_cents
+        """Return current balance in cents.
+
+        Lock-free: reading a single int attribute is atomic under the GIL,
+        so the lock round trip is only needed for read-modify-write ops.
+        """
+        return self.__balance_cents
 
     # ------------ Public operations ------------
 
@@ -60,7 +82,7 @@ class BankAccount:
         if amount_cents <= 0:
             raise ValueError("Deposit amount must be positive.")
         with self.__lock:
-            self.__deposit_unlocked(amount_cents)
+            self.__balance_cents += amount_cents
 
     def withdraw(self, amount_cents: int) -> None:
         """Withdraw positive amount if funds are sufficient."""
@@ -69,7 +91,7 @@ class BankAccount:
         with self.__lock:
             if amount_cents > self.__balance_cents:
                 raise InsufficientFundsError("Insufficient funds.")
-            self.__withdraw_unlocked(amount_cents)
+            self.__balance_cents -= amount_cents
 
     def transfer_to(self, other: "BankAccount", amount_cents: int) -> None:
         """
@@ -91,19 +113,43 @@ class BankAccount:
                 if amount_cents > self.__balance_cents:
                     raise InsufficientFundsError(
                         "Insufficient funds for transfer.")
-                self.__withdraw_unlocked(amount_cents)
-                other.__deposit_unlocked(amount_cents)
+                self.__balance_cents -= amount_cents
+                other.__balance_cents += amount_cents
 
     def __str__(self) -> str:
-        return f"BankAccount({self.account_number}, balance_cents={self.get_balance()})"
+        return "BankAccount(%s, balance_cents=%d)" % (
+            self.account_number, self.get_balance())
+
+
+# ============================================================
+#  Account pool
+# ============================================================
+
+class _AccountPool:
+    """Freelist of BankAccount objects for allocation-heavy runs.
 
-    # ------------ Private helpers (internal only) ------------
+    Acquiring from the pool recycles a released instance (same lock,
+    reset number/balance) instead of paying __init__ plus lock
+    allocation for every account.
+    """
 
-    def __deposit_unlocked(self, amount_cents: int) -> None:
-        self.__balance_cents += amount_cents
+    def __init__(self) -> None:
+        self.__free: List[BankAccount] = []
+        self.__lock = threading.Lock()
 
-    def __withdraw_unlocked(self, amount_cents: int) -> None:
-        self.__balance_cents -= amount_cents
+    def acquire(self, account_number: str, initial_balance_cents: int = 0) -> BankAccount:
+        """Return a reset pooled account, or a new one if the pool is empty."""
+        with self.__lock:
+            account = self.__free.pop() if self.__free else None
+        if account is None:
+            return BankAccount(account_number, initial_balance_cents)
+        account._reset(account_number, initial_balance_cents)
+        return account
+
+    def release(self, account: BankAccount) -> None:
+        """Return an account to the pool for later reuse."""
+        with self.__lock:
+            self.__free.append(account)
 
 
 # ============================================================
@@ -118,41 +164,61 @@ class UserTask(threading.Thread):
         user_id: int,
         primary_account: BankAccount,
         secondary_account: Optional[BankAccount] = None,
-        operations: int = 1000
+        operations: int = 1000,
+        throttle: bool = False
     ) -> None:
         super().__init__(name=f"User-{user_id}")
         self.__primary_account = primary_account
         self.__secondary_account = secondary_account
         self.__operations = operations
+        # Optional pacing between operations; off by default since the
+        # per-op sleep dominates wall-clock time otherwise.
+        self.__throttle = throttle
+        # Pre-generate the whole random plan: batched RNG calls here beat
+        # Python-level RNG calls per operation in run().
+        # Action codes: 0=deposit, 1=withdraw, 2=transfer.
+        self.__actions = array.array(
+            "B", random.choices((0, 1, 2), k=operations))
+        # between £1.00 and £100.00
+        self.__amounts = random.choices(range(100, 10_001), k=operations)
+        # One random bit per operation picks the transfer direction;
+        # a single getrandbits call replaces a fresh two-element
+        # random.choice per transfer.
+        self.__dir_bits = random.getrandbits(operations)
 
     def run(self) -> None:
-        for _ in range(self.__operations):
-            action = random.choice(["deposit", "withdraw", "transfer"])
-            # between £1.00 and £100.00
-            amount_cents = random.randint(100, 10_000)
-
+        # Hot loop: hoist globals, attributes and bound methods into locals
+        # once, so each iteration pays no repeated lookup/dispatch cost.
+        sleep = time.sleep
+        throttle = self.__throttle
+        primary = self.__primary_account
+        secondary = self.__secondary_account
+        deposit = primary.deposit
+        withdraw = primary.withdraw
+        dir_bits = self.__dir_bits
+
+        for i, (action, amount_cents) in enumerate(
+                zip(self.__actions, self.__amounts)):
             try:
-                if action == "deposit":
-                    self.__primary_account.deposit(amount_cents)
+                if action == 0:  # deposit
+                    deposit(amount_cents)
 
-                elif action == "withdraw":
+                elif action == 1:  # withdraw
                     try:
-                        self.__primary_account.withdraw(amount_cents)
+                        withdraw(amount_cents)
                     except InsufficientFundsError:
                         pass
 
-                elif action == "transfer" and self.__secondary_account is not None:
+                elif secondary is not None:  # transfer
                     # Random direction
-                    if random.choice([True, False]):
+                    if (dir_bits >> i) & 1:
                         try:
-                            self.__primary_account.transfer_to(
-                                self.__secondary_account, amount_cents)
+                            primary.transfer_to(secondary, amount_cents)
                         except InsufficientFundsError:
                             pass
                     else:
                         try:
-                            self.__secondary_account.transfer_to(
-                                self.__primary_account, amount_cents)
+                            secondary.transfer_to(primary, amount_cents)
                         except InsufficientFundsError:
                             pass
 
@@ -160,7 +226,8 @@ class UserTask(threading.Thread):
                 # Defensive: should not occur given how amount is generated.
                 pass
 
-            time.sleep(0.0005)
+            if throttle:
+                sleep(0.0005)
 
 
 # ============================================================
@@ -251,6 +318,19 @@ class TestBankAccountSingleThread(unittest.TestCase):
             acc.transfer_to(acc, 100)  # cannot transfer to self
 
 
+class TestAccountPool(unittest.TestCase):
+    """Pool recycles released instances with reset state."""
+
+    def test_pool_reuses_released_account(self) -> None:
+        pool = _AccountPool()
+        first = pool.acquire("POOL-001", 5_000)
+        pool.release(first)
+        second = pool.acquire("POOL-002", 1_000)
+        self.assertIs(first, second)
+        self.assertEqual("POOL-002", second.account_number)
+        self.assertEqual(1_000, second.get_balance())
+
+
 class TestBankAccountConcurrency(unittest.TestCase):
     """Multi-threaded tests for thread safety and deadlocks."""
 